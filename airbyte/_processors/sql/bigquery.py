@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, cast, final
 
@@ -27,6 +28,7 @@ from airbyte.types import SQLTypeConverter
 
 
 if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
     from sqlalchemy.engine.url import URL
 
 
@@ -34,6 +36,16 @@ if TYPE_CHECKING:
     from sqlalchemy.engine.reflection import Inspector
 
 
+@lru_cache
+def _load_service_account_credentials(credentials_path: str) -> Credentials:
+    """Return Google service account credentials from the given file.
+
+    The result is cached so that the credentials file is read and parsed only once, rather than
+    every time we need a new BigQuery client.
+    """
+    return service_account.Credentials.from_service_account_file(credentials_path)
+
+
 class BigQueryConfig(SqlConfig):
     """Configuration for BigQuery."""
 
@@ -84,9 +96,7 @@ class BigQueryConfig(SqlConfig):
     def get_vendor_client(self) -> bigquery.Client:
         """Return a BigQuery python client."""
         if self.credentials_path:
-            credentials = service_account.Credentials.from_service_account_file(
-                self.credentials_path
-            )
+            credentials = _load_service_account_credentials(self.credentials_path)
         else:
             credentials, _ = google.auth.default()
 
@@ -159,8 +169,8 @@ class BigQuerySqlProcessor(SqlProcessorBase):
     ) -> str:
         """Write a file(s) to a new table.
 
-        This is a generic implementation, which can be overridden by subclasses
-        to improve performance.
+        Each file is uploaded as-is (gzipped JSONL) in its own load job, so the data is never
+        parsed or materialized locally.
         """
         temp_table_name = self._create_table_for_loading(stream_name, batch_id)
 
@@ -171,23 +181,29 @@ class BigQuerySqlProcessor(SqlProcessorBase):
 
         # Initialize a BigQuery client
         client = self.sql_config.get_vendor_client()
+        job_config = bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            schema=[
+                bigquery.SchemaField(name, field_type=str(type_))
+                for name, type_ in self._get_sql_column_definitions(stream_name=stream_name).items()
+            ],
+        )
 
+        load_jobs: list[bigquery.LoadJob] = []
         for file_path in files:
             with Path.open(file_path, "rb") as source_file:
-                load_job = client.load_table_from_file(  # Make an API request
-                    file_obj=source_file,
-                    destination=table_id,
-                    job_config=bigquery.LoadJobConfig(
-                        source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
-                        schema=[
-                            bigquery.SchemaField(name, field_type=str(type_))
-                            for name, type_ in self._get_sql_column_definitions(
-                                stream_name=stream_name
-                            ).items()
-                        ],
-                    ),
+                load_jobs.append(
+                    client.load_table_from_file(  # Make an API request (uploads the file)
+                        file_obj=source_file,
+                        destination=table_id,
+                        job_config=job_config,
+                    )
                 )
-            _ = load_job.result()  # Wait for the job to complete
+
+        # Wait for all jobs only after all files are uploaded, so BigQuery can process them in
+        # parallel instead of one at a time.
+        for load_job in load_jobs:
+            _ = load_job.result()
 
         return temp_table_name
 
@@ -258,10 +274,7 @@ class BigQuerySqlProcessor(SqlProcessorBase):
             inspector: Inspector = sqlalchemy.inspect(conn)
             tables = inspector.get_table_names(schema=self.sql_config.schema_name)
             schema_prefix = f"{self.sql_config.schema_name}."
-            return [
-                table.replace(schema_prefix, "", 1) if table.startswith(schema_prefix) else table
-                for table in tables
-            ]
+            return [table.removeprefix(schema_prefix) for table in tables]
 
     def _swap_temp_table_with_final_table(
         self,
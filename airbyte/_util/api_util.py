@@ -13,12 +13,16 @@ directly. This will ensure a single source of truth when mapping between the `ai
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Literal
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import airbyte_api
+import orjson
 import requests
 from airbyte_api import api, models
+from requests.adapters import HTTPAdapter
 
 from airbyte.exceptions import (
     AirbyteConnectionSyncError,
@@ -31,19 +35,32 @@ from airbyte.secrets.base import SecretString
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from concurrent.futures import Future
 
     from airbyte_api.models import (
         DestinationConfiguration,
     )
 
 
-JOB_WAIT_INTERVAL_SECS = 2.0
+T = TypeVar("T")
+
+
+JOB_WAIT_INTERVAL_SECS = 0.5
+"""The initial interval between job status checks, in seconds.
+
+The interval doubles after each check, up to `JOB_WAIT_INTERVAL_MAX_SECS`, and is reset whenever
+the job status changes.
+"""
+JOB_WAIT_INTERVAL_MAX_SECS = 30.0
+"""The maximum interval between job status checks, in seconds."""
 JOB_WAIT_TIMEOUT_SECS_DEFAULT = 60 * 60  # 1 hour
+LIST_MAX_PAGE_SIZE = 100
+"""The largest page size accepted by the Airbyte API when listing resources."""
+LIST_PAGE_SIZE = LIST_MAX_PAGE_SIZE
+"""The default number of resources to request per page when listing resources."""
+LIST_MAX_CONCURRENT_PAGES = 4
+"""The maximum number of pages to request concurrently when listing resources."""
 CLOUD_API_ROOT = "https://api.airbyte.com/v1"
 """The Airbyte Cloud API root URL.
 
@@ -59,6 +76,27 @@ Documentation:
 - https://github.com/airbytehq/airbyte-platform-internal/blob/master/oss/airbyte-api/server-api/src/main/openapi/config.yaml
 """
 
+HTTP_POOL_CONNECTIONS = 16
+"""The number of distinct hosts to keep connection pools for in the shared HTTP session."""
+HTTP_POOL_MAXSIZE = 64
+"""The maximum number of connections to keep alive per host in the shared HTTP session."""
+
+
+@lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """Return the shared HTTP session for all API requests, both direct and through the API SDK.
+
+    Reusing one session keeps connections alive between requests, so consecutive calls (for instance
+    while polling a job's status) skip the TCP and TLS handshakes. The session is created on first
+    use, so importing PyAirbyte does not set up any networking.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE),
+    )
+    return session
+
 
 def status_ok(status_code: int) -> bool:
     """Check if a status code is OK."""
@@ -79,7 +117,10 @@ def get_airbyte_server_instance(
     client_id: SecretString,
     client_secret: SecretString,
 ) -> airbyte_api.AirbyteAPI:
-    """Get an Airbyte instance."""
+    """Get an Airbyte instance.
+
+    All instances share the module's HTTP session and its connection pool.
+    """
     return airbyte_api.AirbyteAPI(
         security=models.Security(
             client_credentials=models.SchemeClientCredentials(
@@ -90,6 +131,7 @@ def get_airbyte_server_instance(
             ),
         ),
         server_url=api_root,
+        client=_get_http_session(),
     )
 
 
@@ -129,44 +171,133 @@ def get_workspace(
 # List resources
 
 
-def list_connections(
-    workspace_id: str,
+def _get_name_filter(
     *,
-    api_root: str,
-    client_id: SecretString,
-    client_secret: SecretString,
-    name: str | None = None,
-    name_filter: Callable[[str], bool] | None = None,
-) -> list[models.ConnectionResponse]:
-    """List connections."""
+    name: str | None,
+    name_filter: Callable[[str], bool] | None,
+) -> Callable[[str], bool]:
+    """Return a single predicate for filtering resources by name.
+
+    Raises an exception if both `name` and `name_filter` are provided.
+    """
     if name and name_filter:
         raise PyAirbyteInputError(message="You can provide name or name_filter, but not both.")
 
-    name_filter = (lambda n: n == name) if name else name_filter or (lambda _: True)
+    if name:
+        return lambda n: n == name
 
-    _ = workspace_id  # Not used (yet)
+    return name_filter or (lambda _: True)
+
+
+def _fetch_all_pages(
+    fetch_page: Callable[[int, int], list[T]],
+    *,
+    page_size: int = LIST_PAGE_SIZE,
+    max_concurrent_pages: int = LIST_MAX_CONCURRENT_PAGES,
+) -> Iterator[T]:
+    """Yield all items from a paginated list endpoint, in order.
+
+    The `fetch_page` callable receives an offset and a limit, and returns the items of that page.
+    The first page is fetched on its own, so that small result sets cost a single request. If the
+    first page is full, subsequent pages are requested concurrently in a sliding window, so that
+    network round trips overlap with each other and with the consumer. We stop requesting new
+    pages as soon as a page comes back with fewer than `page_size` items.
+
+    Raises `PyAirbyteInputError` if `page_size` is not between 1 and `LIST_MAX_PAGE_SIZE`. Larger
+    pages would be capped by the server, and the short page would end the listing early.
+    """
+    if not 1 <= page_size <= LIST_MAX_PAGE_SIZE:
+        raise PyAirbyteInputError(
+            message=f"Page size must be between 1 and {LIST_MAX_PAGE_SIZE}.",
+            input_value=str(page_size),
+        )
+
+    first_page = fetch_page(0, page_size)
+    yield from first_page
+    if len(first_page) < page_size:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_pages) as executor:
+        pending_pages: deque[Future[list[T]]] = deque()
+        next_offset = page_size
+        try:
+            for _ in range(max_concurrent_pages):
+                pending_pages.append(executor.submit(fetch_page, next_offset, page_size))
+                next_offset += page_size
+
+            while pending_pages:
+                page = pending_pages.popleft().result()
+                yield from page
+                if len(page) < page_size:
+                    return
+
+                pending_pages.append(executor.submit(fetch_page, next_offset, page_size))
+                next_offset += page_size
+        finally:
+            # Don't wait on pages we no longer need.
+            for future in pending_pages:
+                future.cancel()
+
+
+def _iter_connections(
+    workspace_id: str,
+    *,
+    api_root: str,
+    client_id: SecretString,
+    client_secret: SecretString,
+    page_size: int = LIST_PAGE_SIZE,
+) -> Iterator[models.ConnectionResponse]:
+    """Iterate over all connections in the workspace, fetching pages as they are needed."""
     airbyte_instance = get_airbyte_server_instance(
         client_id=client_id,
         client_secret=client_secret,
         api_root=api_root,
     )
-    response = airbyte_instance.connections.list_connections(
-        api.ListConnectionsRequest(
-            workspace_ids=[workspace_id],
-        ),
-    )
 
-    if not status_ok(response.status_code) and response.connections_response:
-        raise AirbyteError(
-            context={
-                "workspace_id": workspace_id,
-                "response": response,
-            }
+    def fetch_page(offset: int, limit: int) -> list[models.ConnectionResponse]:
+        response = airbyte_instance.connections.list_connections(
+            api.ListConnectionsRequest(
+                workspace_ids=[workspace_id],
+                offset=offset,
+                limit=limit,
+            ),
         )
-    assert response.connections_response is not None
+        if not status_ok(response.status_code) or response.connections_response is None:
+            raise AirbyteError(
+                context={
+                    "workspace_id": workspace_id,
+                    "response": response,
+                }
+            )
+        return response.connections_response.data
+
+    return _fetch_all_pages(fetch_page, page_size=page_size)
+
+
+def list_connections(
+    workspace_id: str,
+    *,
+    api_root: str,
+    client_id: SecretString,
+    client_secret: SecretString,
+    name: str | None = None,
+    name_filter: Callable[[str], bool] | None = None,
+    page_size: int = LIST_PAGE_SIZE,
+) -> list[models.ConnectionResponse]:
+    """List connections.
+
+    Results are fetched `page_size` items at a time, from 1 up to `LIST_MAX_PAGE_SIZE`.
+    """
+    name_filter = _get_name_filter(name=name, name_filter=name_filter)
     return [
         connection
-        for connection in response.connections_response.data
+        for connection in _iter_connections(
+            workspace_id=workspace_id,
+            api_root=api_root,
+            client_id=client_id,
+            client_secret=client_secret,
+            page_size=page_size,
+        )
         if name_filter(connection.name)
     ]
 
@@ -179,12 +310,13 @@ def list_workspaces(
     client_secret: SecretString,
     name: str | None = None,
     name_filter: Callable[[str], bool] | None = None,
+    page_size: int = LIST_PAGE_SIZE,
 ) -> list[models.WorkspaceResponse]:
-    """List workspaces."""
-    if name and name_filter:
-        raise PyAirbyteInputError(message="You can provide name or name_filter, but not both.")
+    """List workspaces.
 
-    name_filter = (lambda n: n == name) if name else name_filter or (lambda _: True)
+    Results are fetched `page_size` items at a time, from 1 up to `LIST_MAX_PAGE_SIZE`.
+    """
+    name_filter = _get_name_filter(name=name, name_filter=name_filter)
 
     _ = workspace_id  # Not used (yet)
     airbyte_instance: airbyte_api.AirbyteAPI = get_airbyte_server_instance(
@@ -193,22 +325,27 @@ def list_workspaces(
         api_root=api_root,
     )
 
-    response: api.ListWorkspacesResponse = airbyte_instance.workspaces.list_workspaces(
-        api.ListWorkspacesRequest(
-            workspace_ids=[workspace_id],
-        ),
-    )
-
-    if not status_ok(response.status_code) and response.workspaces_response:
-        raise AirbyteError(
-            context={
-                "workspace_id": workspace_id,
-                "response": response,
-            }
+    def fetch_page(offset: int, limit: int) -> list[models.WorkspaceResponse]:
+        response: api.ListWorkspacesResponse = airbyte_instance.workspaces.list_workspaces(
+            api.ListWorkspacesRequest(
+                workspace_ids=[workspace_id],
+                offset=offset,
+                limit=limit,
+            ),
         )
-    assert response.workspaces_response is not None
+        if not status_ok(response.status_code) or response.workspaces_response is None:
+            raise AirbyteError(
+                context={
+                    "workspace_id": workspace_id,
+                    "response": response,
+                }
+            )
+        return response.workspaces_response.data
+
     return [
-        workspace for workspace in response.workspaces_response.data if name_filter(workspace.name)
+        workspace
+        for workspace in _fetch_all_pages(fetch_page, page_size=page_size)
+        if name_filter(workspace.name)
     ]
 
 
@@ -220,12 +357,13 @@ def list_sources(
     client_secret: SecretString,
     name: str | None = None,
     name_filter: Callable[[str], bool] | None = None,
+    page_size: int = LIST_PAGE_SIZE,
 ) -> list[models.SourceResponse]:
-    """List sources."""
-    if name and name_filter:
-        raise PyAirbyteInputError(message="You can provide name or name_filter, but not both.")
+    """List sources.
 
-    name_filter = (lambda n: n == name) if name else name_filter or (lambda _: True)
+    Results are fetched `page_size` items at a time, from 1 up to `LIST_MAX_PAGE_SIZE`.
+    """
+    name_filter = _get_name_filter(name=name, name_filter=name_filter)
 
     _ = workspace_id  # Not used (yet)
     airbyte_instance: airbyte_api.AirbyteAPI = get_airbyte_server_instance(
@@ -233,21 +371,29 @@ def list_sources(
         client_secret=client_secret,
         api_root=api_root,
     )
-    response: api.ListSourcesResponse = airbyte_instance.sources.list_sources(
-        api.ListSourcesRequest(
-            workspace_ids=[workspace_id],
-        ),
-    )
 
-    if not status_ok(response.status_code) and response.sources_response:
-        raise AirbyteError(
-            context={
-                "workspace_id": workspace_id,
-                "response": response,
-            }
+    def fetch_page(offset: int, limit: int) -> list[models.SourceResponse]:
+        response: api.ListSourcesResponse = airbyte_instance.sources.list_sources(
+            api.ListSourcesRequest(
+                workspace_ids=[workspace_id],
+                offset=offset,
+                limit=limit,
+            ),
         )
-    assert response.sources_response is not None
-    return [source for source in response.sources_response.data if name_filter(source.name)]
+        if not status_ok(response.status_code) or response.sources_response is None:
+            raise AirbyteError(
+                context={
+                    "workspace_id": workspace_id,
+                    "response": response,
+                }
+            )
+        return response.sources_response.data
+
+    return [
+        source
+        for source in _fetch_all_pages(fetch_page, page_size=page_size)
+        if name_filter(source.name)
+    ]
 
 
 def list_destinations(
@@ -258,12 +404,13 @@ def list_destinations(
     client_secret: SecretString,
     name: str | None = None,
     name_filter: Callable[[str], bool] | None = None,
+    page_size: int = LIST_PAGE_SIZE,
 ) -> list[models.DestinationResponse]:
-    """List destinations."""
-    if name and name_filter:
-        raise PyAirbyteInputError(message="You can provide name or name_filter, but not both.")
+    """List destinations.
 
-    name_filter = (lambda n: n == name) if name else name_filter or (lambda _: True)
+    Results are fetched `page_size` items at a time, from 1 up to `LIST_MAX_PAGE_SIZE`.
+    """
+    name_filter = _get_name_filter(name=name, name_filter=name_filter)
 
     _ = workspace_id  # Not used (yet)
     airbyte_instance = get_airbyte_server_instance(
@@ -271,23 +418,27 @@ def list_destinations(
         client_secret=client_secret,
         api_root=api_root,
     )
-    response = airbyte_instance.destinations.list_destinations(
-        api.ListDestinationsRequest(
-            workspace_ids=[workspace_id],
-        ),
-    )
 
-    if not status_ok(response.status_code) and response.destinations_response:
-        raise AirbyteError(
-            context={
-                "workspace_id": workspace_id,
-                "response": response,
-            }
+    def fetch_page(offset: int, limit: int) -> list[models.DestinationResponse]:
+        response = airbyte_instance.destinations.list_destinations(
+            api.ListDestinationsRequest(
+                workspace_ids=[workspace_id],
+                offset=offset,
+                limit=limit,
+            ),
         )
-    assert response.destinations_response is not None
+        if not status_ok(response.status_code) or response.destinations_response is None:
+            raise AirbyteError(
+                context={
+                    "workspace_id": workspace_id,
+                    "response": response,
+                }
+            )
+        return response.destinations_response.data
+
     return [
         destination
-        for destination in response.destinations_response.data
+        for destination in _fetch_all_pages(fetch_page, page_size=page_size)
         if name_filter(destination.name)
     ]
 
@@ -556,6 +707,15 @@ def create_destination(
     )
 
 
+_DESTINATION_CONFIGURATION_CLASSES: dict[str, type[DestinationConfiguration]] = {
+    "snowflake": models.DestinationSnowflake,
+    "bigquery": models.DestinationBigquery,
+    "postgres": models.DestinationPostgres,
+    "duckdb": models.DestinationDuckdb,
+}
+"""Destination configuration classes, by destination type, used to parse raw API responses."""
+
+
 def get_destination(
     destination_id: str,
     *,
@@ -578,21 +738,15 @@ def get_destination(
         # TODO: This is a temporary workaround to resolve an issue where
         # the destination API response is of the wrong type.
         # https://github.com/airbytehq/pyairbyte/issues/320
-        raw_response: dict[str, Any] = json.loads(response.raw_response.text)
+        # Parse the raw bytes directly, skipping the text decoding step.
+        raw_response: dict[str, Any] = orjson.loads(response.raw_response.content)
         raw_configuration: dict[str, Any] = raw_response["configuration"]
 
         destination_type = raw_response.get("destinationType")
-        destination_mapping = {
-            "snowflake": models.DestinationSnowflake,
-            "bigquery": models.DestinationBigquery,
-            "postgres": models.DestinationPostgres,
-            "duckdb": models.DestinationDuckdb,
-        }
-
-        if destination_type in destination_mapping:
-            response.destination_response.configuration = destination_mapping[destination_type](
-                **raw_configuration
-            )
+        if destination_type in _DESTINATION_CONFIGURATION_CLASSES:
+            response.destination_response.configuration = _DESTINATION_CONFIGURATION_CLASSES[
+                destination_type
+            ](**raw_configuration)
         return response.destination_response
 
     raise AirbyteMissingResourceError(
@@ -652,15 +806,14 @@ def create_connection(  # noqa: PLR0913  # Too many arguments
         client_secret=client_secret,
         api_root=api_root,
     )
-    stream_configurations: list[models.StreamConfiguration] = []
-    if selected_stream_names:
-        for stream_name in selected_stream_names:
-            stream_configuration = models.StreamConfiguration(
+    stream_configurations_obj = models.StreamConfigurations(
+        [
+            models.StreamConfiguration(
                 name=stream_name,
             )
-            stream_configurations.append(stream_configuration)
-
-    stream_configurations_obj = models.StreamConfigurations(stream_configurations)
+            for stream_name in selected_stream_names or []
+        ]
+    )
     response = airbyte_instance.connections.create_connection(
         models.ConnectionCreateRequest(
             name=name,
@@ -689,17 +842,28 @@ def get_connection_by_name(
     api_root: str,
     client_id: SecretString,
     client_secret: SecretString,
+    require_unique: bool = True,
 ) -> models.ConnectionResponse:
-    """Get a connection."""
-    connections = list_connections(
+    """Get a connection by name.
+
+    Connections are fetched one page at a time, and we stop fetching as soon as the result is
+    known: after a second match if `require_unique` is True (the default), or after the first match
+    otherwise. If `require_unique` is True and more than one connection has the given name, an
+    `AirbyteMultipleResourcesError` is raised.
+    """
+    max_matches = 2 if require_unique else 1
+    found: list[models.ConnectionResponse] = []
+    for connection in _iter_connections(
         workspace_id=workspace_id,
         api_root=api_root,
         client_id=client_id,
         client_secret=client_secret,
-    )
-    found: list[models.ConnectionResponse] = [
-        connection for connection in connections if connection.name == connection_name
-    ]
+    ):
+        if connection.name == connection_name:
+            found.append(connection)
+            if len(found) >= max_matches:
+                break
+
     if len(found) == 0:
         raise AirbyteMissingResourceError(
             connection_name, "connection", f"Workspace: {workspace_id}"
@@ -759,7 +923,7 @@ def get_bearer_token(
     https://reference.airbyte.com/reference/createaccesstoken
 
     """
-    response = requests.post(
+    response = _get_http_session().post(
         url=api_root + "/applications/token",
         headers={
             "content-type": "application/json",
@@ -783,9 +947,15 @@ def _make_config_api_request(
     json: dict[str, Any],
     client_id: SecretString,
     client_secret: SecretString,
+    bearer_token: SecretString | None = None,
 ) -> dict[str, Any]:
+    """Make a request to the Config API.
+
+    If `bearer_token` is provided, it is used as-is. Otherwise a new token is requested using the
+    client credentials.
+    """
     config_api_root = get_config_api_root(api_root)
-    bearer_token = get_bearer_token(
+    bearer_token = bearer_token or get_bearer_token(
         client_id=client_id,
         client_secret=client_secret,
         api_root=api_root,
@@ -795,7 +965,7 @@ def _make_config_api_request(
         "Authorization": f"Bearer {bearer_token}",
         "User-Agent": "PyAirbyte Client",
     }
-    response = requests.request(
+    response = _get_http_session().request(
         method="POST",
         url=config_api_root + path,
         headers=headers,
@@ -824,9 +994,13 @@ def check_connector(
     client_secret: SecretString,
     workspace_id: str | None = None,
     api_root: str = CLOUD_API_ROOT,
+    bearer_token: SecretString | None = None,
 ) -> tuple[bool, str | None]:
     """Check a source.
 
+    If `bearer_token` is provided, it is used instead of requesting a new token with the client
+    credentials.
+
     Raises an exception if the check fails. Uses one of these endpoints:
 
     - /v1/sources/check_connection: https://github.com/airbytehq/airbyte-platform-internal/blob/10bb92e1745a282e785eedfcbed1ba72654c4e4e/oss/airbyte-api/server-api/src/main/openapi/config.yaml#L1409
@@ -842,6 +1016,7 @@ def check_connector(
         api_root=api_root,
         client_id=client_id,
         client_secret=client_secret,
+        bearer_token=bearer_token,
     )
     result, message = json_result.get("status"), json_result.get("message")
 
@@ -74,9 +74,9 @@ class FileWriterBase(AirbyteWriterInterface):
     def _open_new_file(
         self,
         file_path: Path,
-    ) -> IO[str]:
+    ) -> IO[bytes]:
         """Open a new file for writing."""
-        return file_path.open("w", encoding="utf-8")
+        return file_path.open("wb")
 
     def _flush_active_batch(
         self,
@@ -263,7 +263,7 @@ class FileWriterBase(AirbyteWriterInterface):
     def _write_record_dict(
         self,
         record_dict: StreamRecord,
-        open_file_writer: IO[str],
+        open_file_writer: IO[bytes],
     ) -> None:
         """Write one record to a file."""
         raise NotImplementedError("No default implementation.")
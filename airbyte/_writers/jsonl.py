@@ -4,6 +4,8 @@
 from __future__ import annotations
 
 import gzip
+import importlib
+import io
 import json
 from typing import IO, TYPE_CHECKING, cast
 
@@ -17,28 +19,76 @@ from airbyte._writers.file_writers import (
 
 if TYPE_CHECKING:
     from pathlib import Path
+    from types import ModuleType
 
     from airbyte.records import StreamRecord
 
 
+igzip: ModuleType | None
+try:
+    # The ISA-L gzip implementation is several times faster than the standard library's zlib.
+    igzip = importlib.import_module("isal.igzip")
+except ImportError:
+    # If `python-isal` is not installed, we use the standard library `gzip` module instead.
+    igzip = None
+
+WRITE_BUFFER_SIZE = 128 * 1024
+"""The size of the write buffer placed in front of the gzip stream, in bytes.
+
+Each `GzipFile.write()` call runs compression, CRC, and size bookkeeping in Python. Buffering
+coalesces the many small per-record writes into a few large compression calls.
+"""
+
+
 class JsonlWriter(FileWriterBase):
     """A Jsonl cache implementation."""
 
     default_cache_file_suffix = ".jsonl.gz"
     prune_extra_fields = True
 
+    compression_level: int = 6
+    """The gzip compression level, from 1 (fastest) to 9 (smallest).
+
+    These files are transient batches, so we trade a slightly larger file for much faster writes
+    compared to the gzip default of 9. Subclasses may override this value.
+
+    If `python-isal` is installed (`pip install 'airbyte[isal]'`), ISA-L is used instead of the
+    standard library `gzip` module. ISA-L only has levels 0 to 3, so this value is scaled down to
+    that range. The default of 6 maps to ISA-L's own default of 2.
+    """
+
+    def _isal_compression_level(self) -> int:
+        """Return the ISA-L compression level (0 to 3) equivalent to `compression_level`."""
+        return min(max(self.compression_level // 3, 0), 3)
+
     @overrides
     def _open_new_file(
         self,
         file_path: Path,
-    ) -> IO[str]:
-        """Open a new file for writing."""
+    ) -> IO[bytes]:
+        """Open a new file for writing.
+
+        The gzip stream is wrapped in a buffered writer. Closing the buffered writer flushes the
+        buffer and closes the gzip stream, which writes the gzip footer.
+        """
+        gzip_file = (
+            igzip.IGzipFile(  # Avoiding context manager
+                filename=file_path,
+                mode="wb",
+                compresslevel=self._isal_compression_level(),
+            )
+            if igzip
+            else gzip.GzipFile(  # Avoiding context manager
+                filename=file_path,
+                mode="wb",
+                compresslevel=self.compression_level,
+            )
+        )
         return cast(
-            "IO[str]",
-            gzip.open(  # Avoiding context manager
-                file_path,
-                mode="wt",
-                encoding="utf-8",
+            "IO[bytes]",
+            io.BufferedWriter(
+                gzip_file,
+                buffer_size=WRITE_BUFFER_SIZE,
             ),
         )
 
@@ -46,14 +96,14 @@ class JsonlWriter(FileWriterBase):
     def _write_record_dict(
         self,
         record_dict: StreamRecord,
-        open_file_writer: IO[str],
+        open_file_writer: IO[bytes],
     ) -> None:
         # If the record is too nested, `orjson` will fail with error `TypeError: Recursion
         # limit reached`. If so, fall back to the slower `json.dumps`.
         try:
-            open_file_writer.write(orjson.dumps(record_dict).decode(encoding="utf-8") + "\n")
+            open_file_writer.write(orjson.dumps(record_dict, option=orjson.OPT_APPEND_NEWLINE))
         except TypeError:
             # Using isoformat method for datetime serialization
             open_file_writer.write(
-                json.dumps(record_dict, default=lambda _: _.isoformat()) + "\n",
+                (json.dumps(record_dict, default=lambda _: _.isoformat()) + "\n").encode("utf-8"),
             )
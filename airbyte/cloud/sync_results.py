@@ -242,8 +242,14 @@ class SyncResult:
         raise_timeout: bool = True,
         raise_failure: bool = False,
     ) -> JobStatusEnum:
-        """Wait for a job to finish running."""
+        """Wait for a job to finish running.
+
+        The job status is polled with exponential backoff: we check frequently right after the job
+        starts or changes status, and less frequently the longer it stays in the same status.
+        """
         start_time = time.time()
+        wait_interval = api_util.JOB_WAIT_INTERVAL_SECS
+        previous_status: JobStatusEnum | None = None
         while True:
             latest_status = self.get_job_status()
             if latest_status in FINAL_STATUSES:
@@ -253,7 +259,8 @@ class SyncResult:
 
                 return latest_status
 
-            if time.time() - start_time > wait_timeout:
+            elapsed_time = time.time() - start_time
+            if elapsed_time > wait_timeout:
                 if raise_timeout:
                     raise AirbyteConnectionSyncTimeoutError(
                         workspace=self.workspace,
@@ -265,7 +272,13 @@ class SyncResult:
 
                 return latest_status  # This will be a non-final status
 
-            time.sleep(api_util.JOB_WAIT_INTERVAL_SECS)
+            if latest_status != previous_status:
+                wait_interval = api_util.JOB_WAIT_INTERVAL_SECS
+                previous_status = latest_status
+
+            # Don't sleep past the timeout.
+            time.sleep(min(wait_interval, max(wait_timeout - elapsed_time, 0)))
+            wait_interval = min(wait_interval * 2, api_util.JOB_WAIT_INTERVAL_MAX_SECS)
 
     def get_sql_cache(self) -> CacheBase:
         """Return a SQL Cache object for working with the data in a SQL-based destination's."""
@@ -392,7 +392,6 @@ class CloudWorkspace:
                 destination=None,
             )
             for connection in connections
-            if name is None or connection.name == name
         ]
 
     def list_sources(
@@ -416,7 +415,6 @@ class CloudWorkspace:
                 connector_id=source.source_id,
             )
             for source in sources
-            if name is None or source.name == name
         ]
 
     def list_destinations(
@@ -440,5 +438,4 @@ class CloudWorkspace:
                 connector_id=destination.destination_id,
             )
             for destination in destinations
-            if name is None or destination.name == name
         ]
@@ -124,6 +124,8 @@ class StreamRecordHandler:
             self._normalizer.normalize(key) if self._normalize_keys else key
             for key in self._expected_keys
         ]
+        # A set of the index keys, for fast membership checks when pruning extra fields.
+        self.index_keys_set: frozenset[str] = frozenset(self.index_keys)
         self.normalized_keys: list[str] = [
             self._normalizer.normalize(key) for key in self._expected_keys
         ]
@@ -218,16 +220,18 @@ class StreamRecord(dict[str, Any]):
         self.update(dict.fromkeys(stream_record_handler.index_keys))
 
         # Update the dictionary with the given data
+        to_index_case = self._stream_handler.to_index_case
         if self._stream_handler.prune_extra_fields:
+            index_keys_set = self._stream_handler.index_keys_set
             self.update(
                 {
-                    self._stream_handler.to_index_case(k): v
+                    index_key: v
                     for k, v in from_dict.items()
-                    if self._stream_handler.to_index_case(k) in self._stream_handler.index_keys
+                    if (index_key := to_index_case(k)) in index_keys_set
                 }
             )
         else:
-            self.update({self._stream_handler.to_index_case(k): v for k, v in from_dict.items()})
+            self.update({to_index_case(k): v for k, v in from_dict.items()})
 
         if with_internal_columns:
             self.update(
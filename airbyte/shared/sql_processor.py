@@ -838,26 +838,41 @@ class SqlProcessorBase(abc.ABC):
         to improve performance.
         """
         temp_table_name = self._create_table_for_loading(stream_name, batch_id)
-        for file_path in files:
-            dataframe = pd.read_json(file_path, lines=True)
 
-            sql_column_definitions: dict[str, TypeEngine] = self._get_sql_column_definitions(
-                stream_name
+        # Pandas will auto-create the table if it doesn't exist, which we don't want.
+        # This is checked once up front rather than once per file, since each check is a round
+        # trip to the database.
+        if not self._table_exists(temp_table_name):
+            raise exc.PyAirbyteInternalError(
+                message="Table does not exist after creation.",
+                context={
+                    "temp_table_name": temp_table_name,
+                },
+            )
+
+        sql_column_definitions: dict[str, TypeEngine] = self._get_sql_column_definitions(
+            stream_name
+        )
+        # Parse dates based on the declared column types, rather than pandas's column-name
+        # heuristics, which would miss most timestamp columns and mangle any non-date column whose
+        # name happens to look date-like (e.g. "updated_at" declared as a string).
+        date_columns = [
+            col_name
+            for col_name, col_type in sql_column_definitions.items()
+            if isinstance(col_type, (sqlalchemy.types.DATE, sqlalchemy.types.TIMESTAMP))
+        ]
+        for file_path in files:
+            dataframe = pd.read_json(
+                file_path,
+                lines=True,
+                convert_dates=date_columns,
+                keep_default_dates=False,
             )
 
             # Remove fields that are not in the schema
-            for col_name in dataframe.columns:
-                if col_name not in sql_column_definitions:
-                    dataframe = dataframe.drop(columns=col_name)
-
-            # Pandas will auto-create the table if it doesn't exist, which we don't want.
-            if not self._table_exists(temp_table_name):
-                raise exc.PyAirbyteInternalError(
-                    message="Table does not exist after creation.",
-                    context={
-                        "temp_table_name": temp_table_name,
-                    },
-                )
+            dataframe = dataframe[
+                [col_name for col_name in dataframe.columns if col_name in sql_column_definitions]
+            ]
 
             # Normalize all column names to lower case.
             dataframe.columns = Index([self.normalizer.normalize(col) for col in dataframe.columns])
@@ -44,6 +44,12 @@ You can also use this script to test destination load performance:
 poetry run python ./examples/run_perf_test_reads.py -n=5e3 --destination=e2e
 ```
 
+To exclude image pulls and connector startup from the timing, add `--warmup`:
+
+```bash
+poetry run python ./examples/run_perf_test_reads.py -n=5e3 --warmup
+```
+
 Testing raw PyAirbyte throughput with and without caching:
 
 ```bash
@@ -67,9 +73,15 @@ poetry run viztracer --open -- ./examples/run_perf_test_reads.py -n=1e3 --source
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import tempfile
-from decimal import Decimal
-from typing import TYPE_CHECKING
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import airbyte as ab
 from airbyte.caches import BigQueryCache, CacheBase, SnowflakeCache
@@ -80,6 +92,8 @@ from typing_extensions import Literal
 from ulid import ULID
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from airbyte.sources.base import Source
 
 
@@ -92,16 +106,26 @@ def _random_suffix() -> str:
     return ulid[:6] + ulid[-3:]
 
 
-def get_gsm_secret_json(secret_name: str) -> dict:
-    secret_mgr = GoogleGSMSecretManager(
+@functools.lru_cache(maxsize=1)
+def _get_gsm_secret_manager() -> GoogleGSMSecretManager:
+    return GoogleGSMSecretManager(
         project=AIRBYTE_INTERNAL_GCP_PROJECT,
         credentials_json=ab.get_secret("GCP_GSM_CREDENTIALS"),
     )
-    secret = secret_mgr.get_secret(
+
+
+@functools.lru_cache(maxsize=32)
+def get_gsm_secret_json(secret_name: str) -> Mapping[str, Any]:
+    """Fetch and parse a secret from GSM, once per secret name.
+
+    The result is shared between calls, so it is returned as a read-only mapping. Callers must
+    copy it (e.g. with `dict()`) before modifying it.
+    """
+    secret = _get_gsm_secret_manager().get_secret(
         secret_name=secret_name,
     )
     assert secret is not None, "Secret not found."
-    return secret.parse_json()
+    return MappingProxyType(secret.parse_json())
 
 
 def get_cache(
@@ -128,16 +152,19 @@ def get_cache(
         )
 
     if cache_type == "bigquery":
-        temp = tempfile.NamedTemporaryFile(mode="w+", delete=False, encoding="utf-8")
         secret_config = get_gsm_secret_json(
             secret_name="SECRET_DESTINATION-BIGQUERY_CREDENTIALS__CREDS",
         )
-        try:
-            # Write credentials to the temp file
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            delete=False,
+            suffix=".json",
+            encoding="utf-8",
+        ) as temp:
             temp.write(secret_config["credentials_json"])
-            temp.flush()
-        finally:
-            temp.close()
+
+        # The cache reads the credentials file when it connects, so we keep the file until exit.
+        atexit.register(Path(temp.name).unlink, missing_ok=True)
 
         return BigQueryCache(
             project_name=secret_config["project_id"],
@@ -183,8 +210,10 @@ def get_destination(destination_type: str) -> ab.Destination:
         return get_noop_destination()
 
     if destination_type.removeprefix("destination-") == "snowflake":
-        snowflake_config = get_gsm_secret_json(
-            secret_name="AIRBYTE_LIB_SNOWFLAKE_CREDS",
+        snowflake_config = dict(
+            get_gsm_secret_json(
+                secret_name="AIRBYTE_LIB_SNOWFLAKE_CREDS",
+            )
         )
         snowflake_config["host"] = (
             f"{snowflake_config['account']}.snowflakecomputing.com"
@@ -199,13 +228,50 @@ def get_destination(destination_type: str) -> ab.Destination:
     raise ValueError(f"Unknown destination type: {destination_type}")  # noqa: TRY003
 
 
+def warm_up(
+    source_alias: str,
+) -> None:
+    """Run a one-record read, so that image pulls and connector startup are not measured.
+
+    The destination is already warmed up by its `check()` call in `main()`.
+    """
+    warmup_source = get_source(
+        source_alias=source_alias,
+        num_records=1,
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        warmup_source.read(ab.new_local_cache(cache_dir=temp_dir))
+
+
+def parse_record_count(value: str) -> int:
+    """Parse a record count given as a regular number or in scientific notation."""
+    try:
+        num_records = Decimal(value)
+    except InvalidOperation:
+        num_records = None
+
+    if (
+        num_records is None
+        or not num_records.is_finite()
+        or num_records != num_records.to_integral_value()
+        or num_records < 1
+    ):
+        raise argparse.ArgumentTypeError(
+            f"Expected a positive whole number of records, for instance '5e5'. Got: {value!r}"
+        )
+
+    return int(num_records)
+
+
 def main(
     n: int | str = "5e5",
     cache_type: Literal["duckdb", "bigquery", "snowflake", "disabled"] = "disabled",
     source_alias: str = "e2e",
     destination_type: str | None = None,
+    *,
+    warmup: bool = False,
 ) -> None:
-    num_records = int(Decimal(n))
+    num_records = parse_record_count(n) if isinstance(n, str) else n
     cache_type = "duckdb" if cache_type is None else cache_type
 
     cache: CacheBase | Literal[False] = get_cache(
@@ -215,12 +281,23 @@ def main(
         source_alias=source_alias,
         num_records=num_records,
     )
-    source.check()
     destination: Destination | None = None
 
     if destination_type:
         destination = get_destination(destination_type=destination_type)
 
+    # The checks are not timed, but overlapping their connector startups shortens each run.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        checks = [executor.submit(source.check)]
+        if destination:
+            checks.append(executor.submit(destination.check))
+        for check in checks:
+            check.result()
+
+    if warmup:
+        warm_up(source_alias=source_alias)
+
+    start_ns = time.perf_counter_ns()
     if cache is not False:
         read_result = source.read(cache)
         if destination:
@@ -231,17 +308,24 @@ def main(
         )
         destination.write(source, cache=False)
 
+    elapsed_secs = (time.perf_counter_ns() - start_ns) / 1_000_000_000
+    print(
+        f"Processed {num_records:,} records in {elapsed_secs:,.2f} seconds "
+        f"({num_records / elapsed_secs:,.0f} records per second)."
+    )
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Run performance test reads.")
     parser.add_argument(
         "-n",
-        type=str,
+        type=parse_record_count,
         help=(
             "The number of records to generate in the source. "
             "This can be provided in scientific notation, for instance "
             "'2.4e6' for 2.4 million and '5e5' for 500K."
         ),
+        default="5e5",
     )
     parser.add_argument(
         "--cache",
@@ -278,6 +362,15 @@ if __name__ == "__main__":
         choices=["e2e", "noop", "snowflake"],
         default=None,
     )
+    parser.add_argument(
+        "--warmup",
+        action=argparse.BooleanOptionalAction,
+        help=(
+            "Run a one-record read before the measured run, so that image pulls and "
+            "connector startup are excluded from the timing."
+        ),
+        default=False,
+    )
     args = parser.parse_args()
 
     main(
@@ -285,4 +378,5 @@ if __name__ == "__main__":
         cache_type=args.cache if not args.no_cache else "disabled",
         source_alias=args.source,
         destination_type=args.destination,
+        warmup=args.warmup,
     )
@@ -2,6 +2,13 @@
 
 """Test a sync to an Airbyte destination.
 
+This example reads all records into a local cache first, and then writes the cached `ReadResult`
+to the destination. The two phases run one after the other, which is useful when the same cached
+data will be written to more than one destination. To stream records from the source directly
+into the destination instead, overlapping the read and the write, pass the source itself with
+caching disabled: `destination.write(source, cache=False)`. See
+`run_sync_to_destination_wo_cache.py` for a full example.
+
 Usage:
 ```
 poetry run python examples/run_sync_to_destination_from_read_result.py
@@ -11,6 +18,7 @@ poetry run python examples/run_sync_to_destination_from_read_result.py
 from __future__ import annotations
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import airbyte as ab
 
@@ -45,9 +53,14 @@ def get_my_destination() -> ab.Destination:
 def main() -> None:
     """Test writing from the source to the destination."""
     source = get_my_source()
-    source.check()
     destination = get_my_destination()
-    destination.check()
+
+    # Each check starts its own connector, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_check = executor.submit(source.check)
+        destination_check = executor.submit(destination.check)
+        source_check.result()
+        destination_check.result()
 
     read_result: ab.ReadResult = source.read(
         cache=ab.new_local_cache(),
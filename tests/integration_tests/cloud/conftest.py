@@ -1,19 +1,34 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
-"""Fixtures for Cloud Workspace integration tests."""
+"""Fixtures for Cloud Workspace integration tests.
+
+These tests are IO-bound and independent of each other: every resource they create gets a random
+name suffix. They can be run in parallel with `pytest-xdist` (a dev dependency):
+
+```
+poetry run pytest -n 8 --dist=loadgroup tests/integration_tests/cloud/
+```
+
+Tests which must not overlap (for instance, syncs of the same pre-created connection) are marked
+with a shared `xdist_group`, so that they run on the same worker. Session-scoped fixtures are
+created once per worker.
+"""
 
 from __future__ import annotations
 
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Generator
 
 import pytest
-from airbyte._util.api_util import CLOUD_API_ROOT
+from airbyte._util.api_util import CLOUD_API_ROOT, get_bearer_token
 from airbyte._util.temp_files import as_temp_files
 from airbyte._util.venv_util import get_bin_dir
 from airbyte.cloud import CloudWorkspace
+from airbyte.cloud.connections import CloudConnection
+from airbyte.cloud.connectors import CloudDestination, CloudSource
 from airbyte.destinations.base import Destination
 from airbyte.secrets.base import SecretString
 from airbyte.secrets.google_gsm import GoogleGSMSecretManager
@@ -45,12 +60,12 @@ def add_venv_bin_to_path(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("PATH", new_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def workspace_id() -> str:
     return AIRBYTE_CLOUD_WORKSPACE_ID
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def airbyte_cloud_api_root() -> str:
     return CLOUD_API_ROOT
 
@@ -58,7 +73,7 @@ def airbyte_cloud_api_root() -> str:
 CloudAPICreds = tuple[SecretString, SecretString]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def airbyte_cloud_credentials(
     ci_secret_manager: GoogleGSMSecretManager,
 ) -> CloudAPICreds:
@@ -68,26 +83,40 @@ def airbyte_cloud_credentials(
     return SecretString(secret["client_id"]), SecretString(secret["client_secret"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def airbyte_cloud_client_id(
     airbyte_cloud_credentials: CloudAPICreds,
 ) -> SecretString:
     return airbyte_cloud_credentials[0]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def airbyte_cloud_client_secret(
     airbyte_cloud_credentials: CloudAPICreds,
 ) -> SecretString:
     return airbyte_cloud_credentials[1]
 
 
+@pytest.fixture(scope="session")
+def airbyte_cloud_bearer_token(
+    airbyte_cloud_api_root: str,
+    airbyte_cloud_client_id: SecretString,
+    airbyte_cloud_client_secret: SecretString,
+) -> SecretString:
+    """A bearer token for the Config API, requested once and shared by all tests."""
+    return get_bearer_token(
+        client_id=airbyte_cloud_client_id,
+        client_secret=airbyte_cloud_client_secret,
+        api_root=airbyte_cloud_api_root,
+    )
+
+
 @pytest.fixture
 def motherduck_api_key(motherduck_secrets: dict) -> SecretString:
     return SecretString(motherduck_secrets["motherduck_api_key"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cloud_workspace(
     workspace_id: str,
     airbyte_cloud_api_root: str,
@@ -102,6 +131,53 @@ def cloud_workspace(
     )
 
 
+CloudResource = CloudConnection | CloudSource | CloudDestination
+
+
+@pytest.fixture
+def created_cloud_resources(
+    cloud_workspace: CloudWorkspace,
+) -> Generator[list[CloudResource], Any, None]:
+    """A list of deployed resources to permanently delete when the test finishes.
+
+    This fixture is function-scoped: each test's resources are deleted at that test's own teardown,
+    rather than batched into one deletion at session teardown. This way, an interrupted run leaks at
+    most the resources of the tests in flight, and each test's cleanup time counts toward that test.
+
+    Tests append what they deploy instead of deleting it themselves, so that the deletions run in
+    parallel during teardown, even if the test fails. Connections are deleted before the sources
+    and destinations they depend on. Every deletion is attempted, and any failures are reported
+    together at the end.
+    """
+    created_resources: list[CloudResource] = []
+
+    yield created_resources
+
+    def delete_resource(resource: CloudResource) -> None:
+        if isinstance(resource, CloudConnection):
+            cloud_workspace.permanently_delete_connection(resource)
+        elif isinstance(resource, CloudSource):
+            cloud_workspace.permanently_delete_source(resource)
+        else:
+            cloud_workspace.permanently_delete_destination(resource)
+
+    connections = [r for r in created_resources if isinstance(r, CloudConnection)]
+    connectors = [r for r in created_resources if not isinstance(r, CloudConnection)]
+    errors: list[BaseException] = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for batch in (connections, connectors):
+            done, _ = wait([
+                executor.submit(delete_resource, resource) for resource in batch
+            ])
+            errors.extend(error for future in done if (error := future.exception()))
+
+    if errors:
+        pytest.fail(
+            f"Failed to delete {len(errors)} cloud resource(s): "
+            + "; ".join(repr(error) for error in errors)
+        )
+
+
 @pytest.fixture
 def deployable_dummy_source() -> Source:
     """A local PyAirbyte `Source` object.
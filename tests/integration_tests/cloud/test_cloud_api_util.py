@@ -6,6 +6,7 @@ These tests are designed to be run against a running instance of the Airbyte API
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 
 from airbyte_api.models import DestinationResponse, SourceResponse, WorkspaceResponse
@@ -164,36 +165,41 @@ def test_create_and_delete_connection(
     airbyte_cloud_client_secret: SecretString,
     motherduck_api_key: str,
 ) -> None:
-    new_source_name = "deleteme-source-faker" + text_util.generate_random_suffix()
-    new_destination_name = (
-        "deleteme-destination-dummy" + text_util.generate_random_suffix()
-    )
-    new_connection_name = (
-        "deleteme-connection-dummy" + text_util.generate_random_suffix()
-    )
-    source = api_util.create_source(
-        name=new_source_name,
-        api_root=airbyte_cloud_api_root,
-        workspace_id=workspace_id,
-        config=SourceFaker(),
-        client_id=airbyte_cloud_client_id,
-        client_secret=airbyte_cloud_client_secret,
-    )
+    # One suffix is enough to make all three names unique, and it ties them together.
+    name_suffix = text_util.generate_random_suffix()
+    new_source_name = "deleteme-source-faker" + name_suffix
+    new_destination_name = "deleteme-destination-dummy" + name_suffix
+    new_connection_name = "deleteme-connection-dummy" + name_suffix
+    # The source and destination are independent, so we create them concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        source_future = executor.submit(
+            api_util.create_source,
+            name=new_source_name,
+            api_root=airbyte_cloud_api_root,
+            workspace_id=workspace_id,
+            config=SourceFaker(),
+            client_id=airbyte_cloud_client_id,
+            client_secret=airbyte_cloud_client_secret,
+        )
+        destination_future = executor.submit(
+            api_util.create_destination,
+            name=new_destination_name,
+            api_root=airbyte_cloud_api_root,
+            workspace_id=workspace_id,
+            config=DestinationDuckdb(
+                destination_path="temp_db",
+                motherduck_api_key=motherduck_api_key,
+            ),
+            client_id=airbyte_cloud_client_id,
+            client_secret=airbyte_cloud_client_secret,
+        )
+        source = source_future.result()
+        destination = destination_future.result()
+
     assert source.name == new_source_name
     assert source.source_type == "faker"
     assert source.source_id
 
-    destination = api_util.create_destination(
-        name=new_destination_name,
-        api_root=airbyte_cloud_api_root,
-        workspace_id=workspace_id,
-        config=DestinationDuckdb(
-            destination_path="temp_db",
-            motherduck_api_key=motherduck_api_key,
-        ),
-        client_id=airbyte_cloud_client_id,
-        client_secret=airbyte_cloud_client_secret,
-    )
     assert destination.name == new_destination_name
     assert destination.destination_type == "duckdb"
     assert destination.destination_id
@@ -220,20 +226,28 @@ def test_create_and_delete_connection(
         client_id=airbyte_cloud_client_id,
         client_secret=airbyte_cloud_client_secret,
     )
-    api_util.delete_source(
-        source_id=source.source_id,
-        api_root=airbyte_cloud_api_root,
-        workspace_id=workspace_id,
-        client_id=airbyte_cloud_client_id,
-        client_secret=airbyte_cloud_client_secret,
-    )
-    api_util.delete_destination(
-        destination_id=destination.destination_id,
-        api_root=airbyte_cloud_api_root,
-        workspace_id=workspace_id,
-        client_id=airbyte_cloud_client_id,
-        client_secret=airbyte_cloud_client_secret,
-    )
+    # Once the connection is gone, the source and destination can be deleted concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        delete_futures = [
+            executor.submit(
+                api_util.delete_source,
+                source_id=source.source_id,
+                api_root=airbyte_cloud_api_root,
+                workspace_id=workspace_id,
+                client_id=airbyte_cloud_client_id,
+                client_secret=airbyte_cloud_client_secret,
+            ),
+            executor.submit(
+                api_util.delete_destination,
+                destination_id=destination.destination_id,
+                api_root=airbyte_cloud_api_root,
+                workspace_id=workspace_id,
+                client_id=airbyte_cloud_client_id,
+                client_secret=airbyte_cloud_client_secret,
+            ),
+        ]
+        for future in delete_futures:
+            future.result()
 
 
 @pytest.mark.parametrize(
@@ -268,6 +282,7 @@ def test_get_bearer_token(
 def test_check_connector(
     airbyte_cloud_client_id: SecretString,
     airbyte_cloud_client_secret: SecretString,
+    airbyte_cloud_bearer_token: SecretString,
     connector_id: str,
     connector_type: Literal["source", "destination"],
     expect_success: bool,
@@ -278,6 +293,7 @@ def test_check_connector(
             connector_type=connector_type,
             client_id=airbyte_cloud_client_id,
             client_secret=airbyte_cloud_client_secret,
+            bearer_token=airbyte_cloud_bearer_token,
         )
         assert result == expect_success
     except AirbyteError as e:
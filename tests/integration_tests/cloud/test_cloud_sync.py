@@ -21,6 +21,7 @@ def pre_created_connection_id() -> str:
 
 
 @pytest.mark.super_slow
+@pytest.mark.xdist_group("pre_created_connection")
 @pytest.mark.parametrize(
     "pre_created_connection_id",
     [
@@ -39,6 +40,7 @@ def test_run_connection(
     assert sync_result.stream_names
 
 
+@pytest.mark.xdist_group("pre_created_connection")
 def test_get_previous_sync_result(
     cloud_workspace: CloudWorkspace,
     pre_created_connection_id: str,
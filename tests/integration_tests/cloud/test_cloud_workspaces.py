@@ -6,15 +6,22 @@ These tests are designed to be run against a running instance of the Airbyte API
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import airbyte as ab
 from airbyte.cloud import CloudWorkspace
 from airbyte.cloud.connections import CloudConnection
 from airbyte.cloud.connectors import CloudSource
 
 
+if TYPE_CHECKING:
+    from integration_tests.cloud.conftest import CloudResource
+
+
 def test_deploy_destination(
     cloud_workspace: CloudWorkspace,
     deployable_dummy_destination: ab.Destination,
+    created_cloud_resources: list[CloudResource],
 ) -> None:
     """Test deploying a source to a workspace."""
     cloud_destination = cloud_workspace.deploy_destination(
@@ -22,11 +29,12 @@ def test_deploy_destination(
         destination=deployable_dummy_destination,
         random_name_suffix=True,
     )
-    cloud_workspace.permanently_delete_destination(cloud_destination)
+    created_cloud_resources.append(cloud_destination)
 
 
 def test_deploy_source(
     cloud_workspace: CloudWorkspace,
+    created_cloud_resources: list[CloudResource],
 ) -> None:
     """Test deploying a source to a workspace."""
     source = ab.get_source(
@@ -37,13 +45,15 @@ def test_deploy_source(
     cloud_source: CloudSource = cloud_workspace.deploy_source(
         name="test-source",
         source=source,
+        random_name_suffix=True,
     )
-    cloud_workspace.permanently_delete_source(cloud_source)
+    created_cloud_resources.append(cloud_source)
 
 
 def test_deploy_dummy_source(
     deployable_dummy_source: ab.Source,
     cloud_workspace: CloudWorkspace,
+    created_cloud_resources: list[CloudResource],
 ) -> None:
     """Test deploying a source to a workspace."""
     deployable_dummy_source.check()
@@ -51,14 +61,16 @@ def test_deploy_dummy_source(
     cloud_source: CloudSource = cloud_workspace.deploy_source(
         name="test-source",
         source=deployable_dummy_source,
+        random_name_suffix=True,
     )
-    cloud_workspace.permanently_delete_source(cloud_source)
+    created_cloud_resources.append(cloud_source)
 
 
 def test_deploy_connection(
     cloud_workspace: CloudWorkspace,
     deployable_dummy_source: ab.Source,
     deployable_dummy_destination: ab.Destination,
+    created_cloud_resources: list[CloudResource],
 ) -> None:
     """Test deploying a source and cache to a workspace as a new connection."""
     stream_names = deployable_dummy_source.get_selected_streams()
@@ -67,11 +79,13 @@ def test_deploy_connection(
         source=deployable_dummy_source,
         random_name_suffix=True,
     )
+    created_cloud_resources.append(cloud_source)
     cloud_destination = cloud_workspace.deploy_destination(
         name="test-destination",
         destination=deployable_dummy_destination,
         random_name_suffix=True,
     )
+    created_cloud_resources.append(cloud_destination)
 
     connection: CloudConnection = cloud_workspace.deploy_connection(
         connection_name="test-connection",
@@ -80,10 +94,6 @@ def test_deploy_connection(
         selected_streams=stream_names,
         table_prefix="zzz_deleteme_",
     )
+    created_cloud_resources.append(connection)
     assert set(connection.stream_names) == set(stream_names)
     assert connection.table_prefix == "zzz_deleteme_"
-    cloud_workspace.permanently_delete_connection(
-        connection=connection,
-        cascade_delete_source=True,
-        cascade_delete_destination=True,
-    )
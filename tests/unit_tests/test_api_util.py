@@ -0,0 +1,173 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+"""Unit tests for the Airbyte API helpers, which do not require a running Airbyte instance."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_mock
+from airbyte import exceptions as exc
+from airbyte._util import api_util
+from airbyte.secrets.base import SecretString
+
+
+@pytest.mark.parametrize(
+    "num_items, page_size, expected_calls",
+    [
+        pytest.param(0, 10, 1, id="empty"),
+        pytest.param(7, 10, 1, id="partial-first-page"),
+        pytest.param(10, 10, 2, id="exactly-one-page"),
+        pytest.param(95, 10, 10, id="many-pages"),
+    ],
+)
+def test_fetch_all_pages(num_items: int, page_size: int, expected_calls: int) -> None:
+    items = list(range(num_items))
+    requested_offsets: list[int] = []
+
+    def fetch_page(offset: int, limit: int) -> list[int]:
+        requested_offsets.append(offset)
+        return items[offset : offset + limit]
+
+    result = list(
+        api_util._fetch_all_pages(
+            fetch_page,
+            page_size=page_size,
+            max_concurrent_pages=3,
+        )
+    )
+
+    assert result == items
+    # Pages requested speculatively past the end may be cancelled before they run.
+    assert expected_calls <= len(requested_offsets) <= expected_calls + 3
+
+
+def _mock_list_connections(
+    mocker: pytest_mock.MockFixture,
+    connections: list[SimpleNamespace],
+) -> MagicMock:
+    def list_connections(request):
+        return SimpleNamespace(
+            status_code=200,
+            connections_response=SimpleNamespace(
+                data=connections[request.offset : request.offset + request.limit],
+            ),
+        )
+
+    airbyte_instance = MagicMock()
+    airbyte_instance.connections.list_connections.side_effect = list_connections
+    mocker.patch.object(
+        api_util,
+        "get_airbyte_server_instance",
+        return_value=airbyte_instance,
+    )
+    return airbyte_instance.connections.list_connections
+
+
+@pytest.mark.parametrize("page_size", [0, api_util.LIST_MAX_PAGE_SIZE + 1])
+def test_fetch_all_pages_rejects_invalid_page_size(page_size: int) -> None:
+    fetch_page = MagicMock(return_value=[])
+
+    with pytest.raises(exc.PyAirbyteInputError):
+        list(api_util._fetch_all_pages(fetch_page, page_size=page_size))
+
+    fetch_page.assert_not_called()
+
+
+def test_list_connections_paginates(mocker: pytest_mock.MockFixture) -> None:
+    connections = [SimpleNamespace(name=f"connection-{i}") for i in range(250)]
+    _mock_list_connections(mocker, connections)
+
+    result = api_util.list_connections(
+        workspace_id="my-workspace",
+        api_root=api_util.CLOUD_API_ROOT,
+        client_id=SecretString("client-id"),
+        client_secret=SecretString("client-secret"),
+        name_filter=lambda name: name.endswith("7"),
+    )
+
+    assert [connection.name for connection in result] == [
+        connection.name for connection in connections if connection.name.endswith("7")
+    ]
+
+
+@pytest.mark.parametrize(
+    "list_function, resource_type",
+    [
+        pytest.param(api_util.list_workspaces, "workspaces", id="workspaces"),
+        pytest.param(api_util.list_sources, "sources", id="sources"),
+        pytest.param(api_util.list_destinations, "destinations", id="destinations"),
+    ],
+)
+def test_list_resources_paginates(
+    mocker: pytest_mock.MockFixture,
+    list_function,
+    resource_type: str,
+) -> None:
+    resources = [SimpleNamespace(name=f"{resource_type}-{i}") for i in range(55)]
+    requested_limits: list[int] = []
+
+    def list_resources(request):
+        requested_limits.append(request.limit)
+        return SimpleNamespace(
+            status_code=200,
+            **{
+                f"{resource_type}_response": SimpleNamespace(
+                    data=resources[request.offset : request.offset + request.limit],
+                ),
+            },
+        )
+
+    airbyte_instance = MagicMock()
+    getattr(airbyte_instance, resource_type).configure_mock(**{
+        f"list_{resource_type}.side_effect": list_resources
+    })
+    mocker.patch.object(
+        api_util,
+        "get_airbyte_server_instance",
+        return_value=airbyte_instance,
+    )
+
+    result = list_function(
+        workspace_id="my-workspace",
+        api_root=api_util.CLOUD_API_ROOT,
+        client_id=SecretString("client-id"),
+        client_secret=SecretString("client-secret"),
+        page_size=10,
+    )
+
+    assert result == resources
+    assert set(requested_limits) == {10}
+
+
+@pytest.mark.parametrize(
+    "require_unique",
+    [True, False],
+)
+def test_get_connection_by_name_stops_early(
+    mocker: pytest_mock.MockFixture,
+    require_unique: bool,
+) -> None:
+    connections = [SimpleNamespace(name=f"connection-{i}") for i in range(5_000)]
+    connections[3].name = connections[150].name = "duplicate"
+    mock_list_connections = _mock_list_connections(mocker, connections)
+
+    def get_connection_by_name() -> SimpleNamespace:
+        return api_util.get_connection_by_name(
+            workspace_id="my-workspace",
+            connection_name="duplicate",
+            api_root=api_util.CLOUD_API_ROOT,
+            client_id=SecretString("client-id"),
+            client_secret=SecretString("client-secret"),
+            require_unique=require_unique,
+        )
+
+    if require_unique:
+        with pytest.raises(exc.AirbyteMultipleResourcesError):
+            get_connection_by_name()
+    else:
+        assert get_connection_by_name() is connections[3]
+
+    # Far fewer than the 50 pages needed to list every connection.
+    assert mock_list_connections.call_count <= 2 + api_util.LIST_MAX_CONCURRENT_PAGES
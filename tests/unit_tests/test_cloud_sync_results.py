@@ -0,0 +1,27 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest_mock
+from airbyte._util.api_imports import JobStatusEnum
+from airbyte.cloud import sync_results
+from airbyte.cloud.sync_results import SyncResult
+
+
+def test_wait_for_completion_backs_off(mocker: pytest_mock.MockFixture) -> None:
+    statuses = [
+        JobStatusEnum.PENDING,
+        JobStatusEnum.RUNNING,
+        *([JobStatusEnum.RUNNING] * 8),
+        JobStatusEnum.SUCCEEDED,
+    ]
+    mocker.patch.object(SyncResult, "get_job_status", side_effect=statuses)
+    mock_sleep = mocker.patch.object(sync_results.time, "sleep")
+
+    sync_result = SyncResult(workspace=MagicMock(), connection=MagicMock(), job_id=1)
+    assert sync_result.wait_for_completion() == JobStatusEnum.SUCCEEDED
+
+    sleep_intervals = [call.args[0] for call in mock_sleep.call_args_list]
+    # The interval resets when the status changes from pending to running, and is capped.
+    assert sleep_intervals == [0.5, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0, 30.0]
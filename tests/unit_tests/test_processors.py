@@ -73,3 +73,45 @@ def _build_mocked_snowflake_processor(
         temp_file_cleanup=True,
         sql_config=sql_config,
     )
+
+
+def test_bigquery_credentials_loaded_once(
+    mocker: pytest_mock.MockFixture,
+):
+    from airbyte._processors.sql import bigquery as bigquery_processor
+
+    bigquery_processor._load_service_account_credentials.cache_clear()
+    mock_from_file = mocker.patch.object(
+        bigquery_processor.service_account.Credentials,
+        "from_service_account_file",
+    )
+    mocker.patch.object(bigquery_processor.bigquery, "Client")
+    sql_config = bigquery_processor.BigQueryConfig(
+        project_name="my-project",
+        credentials_path="/path/to/credentials.json",
+    )
+
+    for _ in range(3):
+        sql_config.get_vendor_client()
+
+    mock_from_file.assert_called_once_with("/path/to/credentials.json")
+    bigquery_processor._load_service_account_credentials.cache_clear()
+
+
+def test_bigquery_default_credentials_not_cached(
+    mocker: pytest_mock.MockFixture,
+):
+    from airbyte._processors.sql import bigquery as bigquery_processor
+
+    mock_default = mocker.patch.object(
+        bigquery_processor.google.auth,
+        "default",
+        return_value=(mocker.Mock(), "my-project"),
+    )
+    mocker.patch.object(bigquery_processor.bigquery, "Client")
+    sql_config = bigquery_processor.BigQueryConfig(project_name="my-project")
+
+    for _ in range(3):
+        sql_config.get_vendor_client()
+
+    assert mock_default.call_count == 3
@@ -0,0 +1,68 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from airbyte._writers import jsonl
+from airbyte._writers.jsonl import JsonlWriter
+
+
+def _read_jsonl_gz(file_path: Path) -> list[dict]:
+    with gzip.open(file_path, mode="rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("use_isal", [True, False])
+def test_jsonl_writer_round_trip(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    use_isal: bool,
+) -> None:
+    if use_isal and jsonl.igzip is None:
+        pytest.skip("`python-isal` is not installed.")
+    if not use_isal:
+        monkeypatch.setattr(jsonl, "igzip", None)
+
+    writer = JsonlWriter(cache_dir=tmp_path, cleanup=False)
+    file_path = tmp_path / f"stream{writer.default_cache_file_suffix}"
+    records = [{"id": i, "name": f"név-{i}"} for i in range(1_000)]
+
+    open_file_writer = writer._open_new_file(file_path)
+    for record in records:
+        writer._write_record_dict(record, open_file_writer)
+    open_file_writer.close()
+
+    assert _read_jsonl_gz(file_path) == records
+
+
+@pytest.mark.parametrize(
+    "compression_level, expected_isal_level",
+    [(1, 0), (3, 1), (6, 2), (9, 3)],
+)
+def test_jsonl_writer_isal_compression_level(
+    tmp_path: Path,
+    compression_level: int,
+    expected_isal_level: int,
+) -> None:
+    writer = JsonlWriter(cache_dir=tmp_path, cleanup=False)
+    writer.compression_level = compression_level
+
+    assert writer._isal_compression_level() == expected_isal_level
+
+
+def test_jsonl_writer_deeply_nested_record(tmp_path: Path) -> None:
+    """Records too nested for `orjson` fall back to `json.dumps`."""
+    writer = JsonlWriter(cache_dir=tmp_path, cleanup=False)
+    file_path = tmp_path / f"stream{writer.default_cache_file_suffix}"
+    nested: dict = {}
+    for _ in range(300):
+        nested = {"child": nested}
+
+    open_file_writer = writer._open_new_file(file_path)
+    writer._write_record_dict(nested, open_file_writer)
+    open_file_writer.close()
+
+    assert _read_jsonl_gz(file_path) == [nested]